@@ -0,0 +1,61 @@
+import random
+import time
+from recommend import BUDGET_BUCKET, FoodIndex, WorkoutIndex
+
+# Замер рекомендаций на большой базе продуктов: python bench_recommend.py
+
+N_FOODS = 100_000
+N_QUERIES = 1_000
+MAX_BUDGET = 3000
+
+
+# Промах кэша: перед каждым запросом кэш сбрасывается
+def timed_miss(label, index, fn, queries):
+    elapsed = 0
+    for q in queries:
+        index._cache.clear()
+        start = time.perf_counter()
+        fn(q)
+        elapsed += time.perf_counter() - start
+    report(f"{label}, промах кэша", elapsed, len(queries))
+
+
+# Попадание в кэш: корзины заранее прогреты
+def timed_hit(label, index, fn, queries):
+    for q in queries:
+        fn(q)
+    start = time.perf_counter()
+    for q in queries:
+        fn(q)
+    report(f"{label}, попадание в кэш", time.perf_counter() - start, len(queries))
+
+
+def report(label, elapsed, count):
+    print(f"{label}: {elapsed * 1000:.1f} мс на {count} запросов "
+          f"({elapsed / count * 1e6:.1f} мкс/запрос)")
+
+
+def main():
+    random.seed(0)
+    foods = {f"продукт {i}": random.randint(10, 900) for i in range(N_FOODS)}
+    workouts = {f"тренировка {i}": random.randint(2, 15) for i in range(50)}
+
+    start = time.perf_counter()
+    food_index = FoodIndex(foods)
+    workout_index = WorkoutIndex(workouts)
+    print(f"Индекс на {len(food_index)} продуктов: {(time.perf_counter() - start) * 1000:.1f} мс")
+
+    # по одному запросу на корзину - для промахов
+    buckets = [b + random.uniform(0, BUDGET_BUCKET) for b in range(0, MAX_BUDGET, BUDGET_BUCKET)]
+    queries = [random.uniform(50, MAX_BUDGET) for _ in range(N_QUERIES)]
+
+    for label, index, fn in (
+            ("Продукты под бюджет", food_index, food_index.foods_for_budget),
+            ("Сочетания", food_index, food_index.combos_for_budget),
+            ("Тренировки под избыток", workout_index, workout_index.workouts_for_excess)):
+        timed_miss(label, index, fn, buckets)
+        timed_hit(label, index, fn, queries)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+from bisect import bisect_left, bisect_right
+from itertools import combinations, product
+from math import ceil
+
+# Порции в граммах, из которых собираются рекомендации
+PORTIONS = (100, 150, 200, 250, 300)
+MIN_PORTION = PORTIONS[0]
+MAX_PORTION = PORTIONS[-1]
+
+# Разумная длительность тренировки, мин
+MIN_WORKOUT = 20
+MAX_WORKOUT = 90
+
+# Шаг корзины бюджета для кэша, ккал
+BUDGET_BUCKET = 50
+
+# Размеры выдачи
+TOP_FOODS = 5
+TOP_COMBOS = 3
+TOP_WORKOUTS = 3
+
+# Сколько кандидатов держим в кэше корзины, чтобы после
+# отсева по точному бюджету хватило на выдачу
+FOOD_POOL = 20
+COMBO_POOL = 12
+COMBO_ITEMS = 3
+
+# Потолок целевой калорийности, ккал на 100 г: при большом бюджете
+# не предлагаем первыми шоколад и печенье
+MAX_TARGET_KCAL = 200
+
+
+# Индекс продуктов по калорийности (ккал на 100 г).
+# Отсортированный массив + bisect: поиск по бюджету за O(log n + k).
+# Кэш по корзинам бюджета хранит кандидатов, порции подбираются под точный бюджет
+class FoodIndex:
+    def __init__(self, foods: dict[str, float]):
+        items = sorted((kcal, name) for name, kcal in foods.items() if kcal > 0)
+        self.kcal = [kcal for kcal, _ in items]
+        self.names = [name for _, name in items]
+        self._cache = {}
+
+    def __len__(self):
+        return len(self.kcal)
+
+    # Продукты, минимальная порция которых влезает в бюджет.
+    # Ближе всего к цели те, у кого порция ~MAX_PORTION закрывает бюджет целиком
+    def nearest(self, budget: float, k: int) -> list[tuple[str, float]]:
+        hi = bisect_right(self.kcal, budget * 100 / MIN_PORTION)
+        if hi == 0:
+            return []
+        target = min(budget * 100 / MAX_PORTION, MAX_TARGET_KCAL)
+        pos = min(bisect_left(self.kcal, target), hi)
+        # расходимся от позиции target в обе стороны
+        left, right = pos - 1, pos
+        found = []
+        while len(found) < k and (left >= 0 or right < hi):
+            take_right = right < hi and (
+                left < 0 or self.kcal[right] - target <= target - self.kcal[left])
+            if take_right:
+                found.append((self.names[right], self.kcal[right]))
+                right += 1
+            else:
+                found.append((self.names[left], self.kcal[left]))
+                left -= 1
+        return found
+
+    # Продукты и порции под оставшийся бюджет
+    def foods_for_budget(self, budget: float) -> list[tuple[str, int, float]]:
+        bucket = _bucket(budget)
+        if bucket == 0:
+            # в нижней корзине пул по ее верхнему краю уходит выше бюджета,
+            # поэтому ищем по точному бюджету без кэша
+            pool = self.nearest(budget, TOP_FOODS)
+        else:
+            key = ("foods", bucket)
+            if key not in self._cache:
+                self._cache[key] = self.nearest(bucket + BUDGET_BUCKET, FOOD_POOL)
+            pool = self._cache[key]
+        recs = []
+        for name, kcal in pool:
+            grams = _best_portion(kcal, budget)
+            if grams is None:
+                continue
+            recs.append((name, grams, kcal * grams / 100))
+            if len(recs) == TOP_FOODS:
+                break
+        return recs
+
+    # Сочетания из нескольких продуктов: ограниченный перебор в духе рюкзака.
+    # Каждый продукт берем не больше одного раза, порция из PORTIONS.
+    # Выше всего сочетания, ближе всех подходящие к бюджету, и с разными продуктами
+    def combos_for_budget(self, budget: float) -> list[list[tuple[str, int, float]]]:
+        bucket = _bucket(budget)
+        key = ("combos", bucket)
+        if key not in self._cache:
+            self._cache[key] = self._combo_options(bucket)
+        ranked = []
+        for foods, options in self._cache[key]:
+            fit = [option for option in options if option[0] <= budget]
+            if fit:
+                total, grams = fit[-1]
+                ranked.append((budget - total, foods, grams))
+        ranked.sort(key=lambda x: x[0])
+
+        picked, used = [], set()
+        for i, (_, foods, _) in enumerate(ranked):
+            names = {name for name, _ in foods}
+            if not names & used:
+                picked.append(i)
+                used |= names
+            if len(picked) == TOP_COMBOS:
+                break
+        # разных сочетаний не хватило - добираем ближайшими к бюджету
+        for i in range(len(ranked)):
+            if len(picked) == TOP_COMBOS:
+                break
+            if i not in picked:
+                picked.append(i)
+
+        combos = []
+        for i in picked:
+            _, foods, grams = ranked[i]
+            combos.append([(name, g, kcal * g / 100) for (name, kcal), g in zip(foods, grams)])
+        return combos
+
+    # Для каждого набора продуктов - варианты порций, нужные бюджетам корзины:
+    # лучший вариант не больше начала корзины и все варианты внутри нее
+    def _combo_options(self, bucket: int) -> list:
+        top = bucket + BUDGET_BUCKET
+        # в сочетании каждый продукт закрывает примерно свою долю бюджета
+        pool = self.nearest(top / COMBO_ITEMS, COMBO_POOL)
+        found = []
+        for size in range(2, COMBO_ITEMS + 1):
+            for foods in combinations(pool, size):
+                # самый легкий вариант не влезает, остальные порции тоже
+                if sum(kcal for _, kcal in foods) * MIN_PORTION / 100 > top:
+                    continue
+                options = []
+                for grams in product(PORTIONS, repeat=size):
+                    total = sum(kcal * g / 100 for (_, kcal), g in zip(foods, grams))
+                    if total <= top:
+                        options.append((total, grams))
+                options.sort(key=lambda x: x[0])
+                below = [option for option in options if option[0] <= bucket]
+                options = below[-1:] + [option for option in options if option[0] > bucket]
+                found.append((foods, options))
+        return found
+
+
+# Корзина бюджета для кэша: округляем вниз до BUDGET_BUCKET
+def _bucket(budget: float) -> int:
+    return max(int(budget // BUDGET_BUCKET) * BUDGET_BUCKET, 0)
+
+
+# Самая большая порция, которая влезает в бюджет; None, если не влезает ни одна
+def _best_portion(kcal: float, budget: float) -> int | None:
+    fit = [g for g in PORTIONS if kcal * g / 100 <= budget]
+    return fit[-1] if fit else None
+
+
+# Индекс тренировок по расходу (ккал в минуту)
+class WorkoutIndex:
+    def __init__(self, workouts: dict[str, float]):
+        items = sorted((rate, name) for name, rate in workouts.items() if rate > 0)
+        self.rates = [rate for rate, _ in items]
+        self.names = [name for _, name in items]
+        self._cache = {}
+
+    # Тренировки, которыми можно сжечь избыток за MIN_WORKOUT..MAX_WORKOUT минут.
+    # Если таких нет, берем ближайшую по интенсивности
+    def workouts_for_excess(self, excess: float) -> list[tuple[str, int]]:
+        bucket = _bucket(excess)
+        if bucket not in self._cache:
+            lo = bisect_left(self.rates, bucket / MAX_WORKOUT)
+            hi = bisect_right(self.rates, (bucket + BUDGET_BUCKET) / MIN_WORKOUT)
+            self._cache[bucket] = range(lo, hi)
+        fit = [i for i in self._cache[bucket]
+               if MIN_WORKOUT <= excess / self.rates[i] <= MAX_WORKOUT]
+        idx = fit[::-1][:TOP_WORKOUTS] or self._fallback(excess)
+        return [(self.names[i], _minutes(excess, self.rates[i])) for i in idx]
+
+    def _fallback(self, excess: float) -> list[int]:
+        if not self.rates:
+            return []
+        return [min(bisect_left(self.rates, excess / MAX_WORKOUT), len(self.rates) - 1)]
+
+
+# Минуты тренировки округляем вверх, но не меньше одной
+def _minutes(excess: float, rate: float) -> int:
+    return max(ceil(excess / rate), 1)
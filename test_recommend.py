@@ -0,0 +1,96 @@
+from recommend import (
+    BUDGET_BUCKET, MAX_PORTION, MAX_WORKOUT, MIN_PORTION, TOP_COMBOS,
+    FoodIndex, WorkoutIndex)
+
+FOODS = {
+    "огурец": 16, "помидор": 18, "салат": 25, "яблоко": 52, "банан": 89,
+    "рис": 130, "курица": 165, "говядина": 250, "сыр": 402, "шоколад": 546}
+
+WORKOUTS = {"йога": 3, "ходьба": 4, "велосипед": 8, "бег": 10}
+
+
+def total(items):
+    return sum(calories for _, _, calories in items)
+
+
+def test_budget_below_bucket():
+    recs = FoodIndex(FOODS).foods_for_budget(30)
+    assert {name for name, _, _ in recs} == {"огурец", "помидор", "салат"}
+    assert all(calories <= 30 for _, _, calories in recs)
+
+
+def test_budget_below_any_portion():
+    index = FoodIndex(FOODS)
+    assert index.foods_for_budget(10) == []
+    assert index.combos_for_budget(10) == []
+
+
+def test_budget_below_lightest_fixture_food():
+    index = FoodIndex({**FOODS, "вода с лимоном": 5, "сельдерей": 8})
+    recs = index.foods_for_budget(10)
+    assert {name for name, _, _ in recs} == {"вода с лимоном", "сельдерей"}
+    assert all(calories <= 10 for _, _, calories in recs)
+
+
+def test_exact_budget_inside_bucket():
+    index = FoodIndex(FOODS)
+    low = index.foods_for_budget(BUDGET_BUCKET)
+    high = index.foods_for_budget(2 * BUDGET_BUCKET - 1)
+    assert max(calories for _, _, calories in high) > BUDGET_BUCKET
+    assert all(calories <= BUDGET_BUCKET for _, _, calories in low)
+    assert all(calories <= 2 * BUDGET_BUCKET - 1 for _, _, calories in high)
+
+
+def test_bucket_boundary():
+    index = FoodIndex(FOODS)
+    for budget in (BUDGET_BUCKET - 0.5, BUDGET_BUCKET, BUDGET_BUCKET + 0.5):
+        for _, grams, calories in index.foods_for_budget(budget):
+            assert MIN_PORTION <= grams <= MAX_PORTION
+            assert calories <= budget
+
+
+def test_large_budget_avoids_dense_foods():
+    names = [name for name, _, _ in FoodIndex(FOODS).foods_for_budget(2500)]
+    assert names[0] not in ("шоколад", "сыр")
+
+
+def test_combos_fit_real_budget():
+    index = FoodIndex(FOODS)
+    combos = index.combos_for_budget(149)
+    assert combos
+    assert all(total(combo) <= 149 for combo in combos)
+    assert total(combos[0]) > 100
+
+
+def test_combos_prefer_different_foods():
+    combos = FoodIndex(FOODS).combos_for_budget(500)
+    assert len(combos) == TOP_COMBOS
+    first = {name for name, _, _ in combos[0]}
+    second = {name for name, _, _ in combos[1]}
+    assert not first & second
+
+
+def test_empty_food_index():
+    index = FoodIndex({})
+    assert len(index) == 0
+    assert index.foods_for_budget(500) == []
+    assert index.combos_for_budget(500) == []
+
+
+def test_workouts_in_range():
+    recs = WorkoutIndex(WORKOUTS).workouts_for_excess(300)
+    assert [name for name, _ in recs] == ["бег", "велосипед", "ходьба"]
+    assert [minutes for _, minutes in recs] == [30, 38, 75]
+
+
+def test_workouts_excess_too_large():
+    excess = 10 * MAX_WORKOUT * 2
+    assert WorkoutIndex(WORKOUTS).workouts_for_excess(excess) == [("бег", 180)]
+
+
+def test_workouts_tiny_excess():
+    assert WorkoutIndex(WORKOUTS).workouts_for_excess(0.4) == [("йога", 1)]
+
+
+def test_empty_workout_index():
+    assert WorkoutIndex({}).workouts_for_excess(300) == []
@@ -3,6 +3,7 @@ import matplotlib.pyplot as plt
 from io import BytesIO
 from config import WEATHER_API_KEY
 from difflib import get_close_matches
+from recommend import FoodIndex, WorkoutIndex
 
 # Получение температуры из OpenWeather
 
@@ -113,24 +114,29 @@ WORKOUT_CALORIES = {
     "йога": 3, 
     "тренажер": 6,}
 
+# Индексы для рекомендаций строим один раз при загрузке
+FOOD_INDEX = FoodIndex(LOCAL_FOODS)
+WORKOUT_INDEX = WorkoutIndex(WORKOUT_CALORIES)
+
 # рекомендации
 def simple_recommend(calories_left):
     recs = []
     if calories_left > 0:
         recs.append(f"Можно съесть еще {calories_left:.0f} ккал")
-        top_5 = list(LOCAL_FOODS.items())[:5]  # берем первые 5 продуктов
-        for food_name, calories in top_5:
-            if calories > 0:
-                grams = (calories_left / calories) * 100
-                recs.append(f"• {food_name}: {grams:.0f}г")
+        # продукты, порция которых влезает в остаток
+        for food_name, grams, calories in FOOD_INDEX.foods_for_budget(calories_left):
+            recs.append(f"• {food_name}: {grams}г ({calories:.0f} ккал)")
+        combos = FOOD_INDEX.combos_for_budget(calories_left)
+        if combos:
+            recs.append("Или сочетания:")
+        for combo in combos:
+            total = sum(calories for _, _, calories in combo)
+            items = " + ".join(f"{food_name} {grams}г" for food_name, grams, _ in combo)
+            recs.append(f"• {items} ({total:.0f} ккал)")
     elif calories_left < 0:
         # Переели нужно сжечь
         excess = abs(calories_left)
         recs.append(f"Переели на {excess:.0f} ккал")
-        # Используем существующие тренировки из WORKOUT_CALORIES
-        for workout, cal_per_min in WORKOUT_CALORIES.items():
-            if cal_per_min > 0:
-                minutes = excess / cal_per_min
-                recs.append(f"• {workout}: {minutes:.0f} мин")
-                break  # только одну тренировку показываем
-    return recs
\ No newline at end of file
+        for workout, minutes in WORKOUT_INDEX.workouts_for_excess(excess):
+            recs.append(f"• {workout}: {minutes} мин")
+    return recs